@@ -7,49 +7,352 @@ Windows와 macOS에서 모두 동작하는 YouTube 썸네일 다운로더
 
 import sys
 import os
+import io
 import re
-import requests
-from urllib.parse import urlparse, parse_qs
+import json
+import time
+import copy
+import shutil
+import functools
+import threading
 from pathlib import Path
+from datetime import datetime
 import platform
+from urllib.parse import urlparse
 
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                             QWidget, QLabel, QLineEdit, QPushButton, QTextEdit, 
                             QFileDialog, QMessageBox, QProgressBar, QComboBox,
-                            QGroupBox, QGridLayout)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
-from PyQt5.QtGui import QPixmap, QFont, QIcon
-from PIL import Image
-import yt_dlp
+                            QGroupBox, QGridLayout, QCheckBox, QAction)
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, Qt
+from PyQt5.QtGui import QFont
 
 
-class ThumbnailDownloader(QThread):
-    """썸네일 다운로드를 위한 워커 스레드"""
+# 동시 다운로드 작업 수 (스레드 풀 크기 = 호스트별 커넥션 풀 크기)
+_MAX_WORKERS = 8
+
+# 썸네일 다운로드에 재사용할 HTTP 세션 (keep-alive / 커넥션 풀링, 처음 사용할 때 생성)
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# 기본 저장 경로 (Windows, macOS, Linux 모두 바탕화면)
+_DEFAULT_SAVE_PATH = Path.home() / "Desktop"
+
+# 비디오 정보 디스크 캐시 (비디오 ID별 JSON, 24시간 유지)
+_CACHE_DIR = Path.home() / ".yd_cache"
+_CACHE_TTL = 24 * 60 * 60
+
+# YouTube URL 패턴 (첫 번째 그룹이 11자리 비디오 ID)
+_YT_URL_RE = re.compile(r'(?:youtube\.com/(?:watch\?(?:[^&]*&)*v=|embed/)|youtu\.be/)([a-zA-Z0-9_-]{11})')
+
+# 입력창의 여러 URL 구분자 (공백/쉼표)
+_URL_SPLIT_RE = re.compile(r'[\s,]+')
+
+# YouTube 비디오 ID 형식 (재생목록 항목 검사용)
+_VIDEO_ID_RE = re.compile(r'[a-zA-Z0-9_-]{11}')
+
+# 재생목록 URL 패턴 (첫 번째 그룹이 재생목록 ID)
+_YT_PLAYLIST_RE = re.compile(r'(?:^|//|\.)youtube\.com/(?:playlist|watch)\?(?:[^&]*&)*list=([a-zA-Z0-9_-]+)')
+
+# 그대로 저장할 썸네일 확장자 (그 외는 .jpg)
+_THUMBNAIL_EXTS = frozenset({'.jpg', '.png', '.webp'})
+
+# 파일명에 사용할 수 없는 문자
+_FNAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# 품질 옵션별 i.ytimg.com 썸네일 파일명 (직접 확인의 시작점, yt-dlp 목록 선택에도 사용)
+_QUALITY_TO_NAME = {
+    'maxres': 'maxresdefault',  # 1280x720 이상
+    'high': 'hq720',            # 1280x720
+    'medium': 'sddefault',      # 640x480
+    'standard': 'hqdefault',    # 480x360
+    'default': 'default',       # 120x90
+}
+
+# i.ytimg.com 썸네일 파일명과 해당하는 품질 옵션 (실제 해상도 높은 순, 없으면 다음 단계로)
+_THUMBNAIL_TIERS = [
+    ('maxresdefault', 'maxres'),  # 1280x720 이상
+    ('hq720', 'high'),            # 1280x720
+    ('sddefault', 'medium'),      # 640x480
+    ('hqdefault', 'standard'),    # 480x360
+    ('mqdefault', 'default'),     # 320x180
+    ('default', 'default'),       # 120x90
+]
+
+# 이 크기(바이트)보다 작은 응답은 YouTube 기본 이미지로 보고 건너뜀
+_PLACEHOLDER_MAX_BYTES = 2000
+
+# 품질별 썸네일 ID/파일명 우선순위 (yt-dlp 썸네일 목록에서 선택할 때, 직접 확인과 같은 파일)
+_QUALITY_PREFERENCES = {
+    quality: [name, quality] for quality, name in _QUALITY_TO_NAME.items()
+}
+
+# 품질별 썸네일 너비 범위 (ID로 찾지 못했을 때)
+_QUALITY_WIDTH_RANGES = {
+    'high': (1280, float('inf')),
+    'medium': (640, 1280),
+    'standard': (480, 640),
+}
+
+# 메타데이터 전용 yt-dlp 옵션 (사용하는 필드: title, thumbnails[id/url/width/height], entries[id])
+_INFO_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'no_color': True,
+    'skip_download': True,
+    'getcomments': False,
+    'check_formats': False,
+    'youtube_include_dash_manifest': False,
+    'extractor_args': {'youtube': {'player_skip': ['configs', 'webpage']}},
+}
+
+# 스레드별 YoutubeDL 인스턴스 (YoutubeDL은 스레드 안전하지 않음)
+_YDL_LOCAL = threading.local()
+
+
+def _get_session():
+    """공유 HTTP 세션 반환 (requests는 import 비용이 크므로 처음 사용할 때 불러옴)"""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                # 일시적인 서버 오류(429/5xx)는 같은 연결에서 백오프 후 재시도
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=frozenset({429, 500, 502, 503, 504}),
+                    allowed_methods=frozenset({'GET', 'HEAD'}),
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=_MAX_WORKERS,
+                                                      max_retries=retry))
+                session.headers.update({'User-Agent': 'YouTube Thumbnail Downloader/1.0'})
+                _SESSION = session
+    return _SESSION
+
+
+def extract_video_id(url):
+    """URL에서 11자리 비디오 ID 추출 (실패 시 None)"""
+    match = _YT_URL_RE.search(url)
+    return match.group(1) if match else None
+
+
+def extract_playlist_id(url):
+    """비디오 ID 없는 재생목록 URL에서 재생목록 ID 추출 (아니면 None)"""
+    if extract_video_id(url) is not None:
+        return None
+    match = _YT_PLAYLIST_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _info_opts(**overrides):
+    """메타데이터 전용 yt-dlp 옵션의 새 복사본 반환 (YoutubeDL이 params를 직접 수정하므로)"""
+    opts = copy.deepcopy(_INFO_OPTS)
+    opts.update(overrides)
+    return opts
+
+
+def _get_ydl():
+    """현재 스레드의 YoutubeDL 인스턴스 반환 (없으면 생성)"""
+    ydl = getattr(_YDL_LOCAL, 'ydl', None)
+    if ydl is None:
+        # yt-dlp는 import 비용이 크므로 처음 사용할 때 불러옴
+        import yt_dlp
+        
+        ydl = _YDL_LOCAL.ydl = yt_dlp.YoutubeDL(_info_opts())
+    return ydl
+
+
+def _load_cached_info(video_id):
+    """디스크 캐시에서 비디오 정보 읽기 (없거나 만료되면 None)"""
+    cache_file = _CACHE_DIR / f"{video_id}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime > _CACHE_TTL:
+            # 만료된 항목은 삭제해 캐시 폴더가 계속 커지지 않게 함
+            cache_file.unlink(missing_ok=True)
+            return None
+        return json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_info(video_id, info):
+    """비디오 정보를 디스크 캐시에 저장 (실패해도 무시)"""
+    cache_file = _CACHE_DIR / f"{video_id}.json"
+    tmp_file = _CACHE_DIR / f"{video_id}.{threading.get_ident()}.tmp"
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(info, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_info(video_id):
+    """비디오 정보 가져오기 (비디오 ID 기준으로 메모리/디스크 캐시)"""
+    info = _load_cached_info(video_id)
+    if info is not None:
+        return info
+    
+    info = _get_ydl().extract_info(f"https://youtu.be/{video_id}", download=False)
+    # 썸네일 다운로드에 필요한 필드만 저장 (formats 등 큰 데이터 제외)
+    info = {
+        'title': info.get('title', 'Unknown'),
+        'thumbnails': [
+            {key: thumb[key] for key in ('id', 'url', 'width', 'height') if key in thumb}
+            for thumb in info.get('thumbnails') or []
+        ],
+    }
+    _store_cached_info(video_id, info)
+    return info
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_title(video_id):
+    """oEmbed로 비디오 제목만 가져오기 (yt-dlp 추출 생략)"""
+    # 이미 가져온 비디오 정보가 있으면 재사용
+    cached = _load_cached_info(video_id)
+    if cached is not None:
+        return cached.get('title', video_id)
+    
+    response = _get_session().get(
+        "https://www.youtube.com/oembed",
+        params={'url': f"https://www.youtube.com/watch?v={video_id}", 'format': 'json'},
+        timeout=(5, 10),
+    )
+    response.raise_for_status()
+    return response.json().get('title', video_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_thumbnail_url(video_id, quality, session):
+    """i.ytimg.com에 HEAD 요청해 (품질, URL) 반환 (200/404 응답만 캐시, 그 외는 예외)"""
+    start_name = _QUALITY_TO_NAME.get(quality)
+    start = next((i for i, (name, _) in enumerate(_THUMBNAIL_TIERS)
+                  if name == start_name), 0)
+    for name, candidate in _THUMBNAIL_TIERS[start:]:
+        url = f"https://i.ytimg.com/vi/{video_id}/{name}.jpg"
+        response = session.head(url, timeout=(5, 10))
+        # 404만 "해당 품질 없음"으로 보고 다음 단계로, 그 외 오류는 예외로 전달
+        if response.status_code == 404:
+            continue
+        response.raise_for_status()
+        if response.status_code != 200:
+            # 리다이렉트 등 확정되지 않은 응답도 캐시하지 않음
+            raise OSError(f"예상하지 못한 응답 ({response.status_code}): {url}")
+        # 썸네일이 없으면 120x90 회색 기본 이미지를 주는 경우가 있어 크기로 구분
+        # ('default'는 원래 120x90이므로 제외)
+        content_length = response.headers.get('content-length')
+        if (name != 'default' and content_length
+                and int(content_length) < _PLACEHOLDER_MAX_BYTES):
+            continue
+        return candidate, url
+    return None
+
+
+def clear_info_cache():
+    """메모리/디스크의 비디오 정보 캐시 삭제"""
+    _probe_thumbnail_url.cache_clear()
+    _fetch_info.cache_clear()
+    _fetch_title.cache_clear()
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+
+
+class DownloaderSignals(QObject):
+    """워커 작업의 시그널 (QRunnable은 QObject가 아니므로 분리)"""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
+
+
+class PlaylistSignals(QObject):
+    """재생목록 작업의 시그널"""
+    progress = pyqtSignal(str)
+    finished = pyqtSignal(bool, str, list)
+
+
+class PlaylistLoader(QRunnable):
+    """재생목록의 비디오 ID 목록을 가져오는 스레드 풀 작업"""
     
-    def __init__(self, url, save_path, quality):
+    def __init__(self, url):
         super().__init__()
         self.url = url
-        self.save_path = save_path
-        self.quality = quality
+        self.signals = PlaylistSignals()
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
     
     def run(self):
         try:
-            self.progress.emit("YouTube URL 정보를 가져오는 중...")
+            self.progress.emit(f"재생목록 정보를 가져오는 중... ({self.url})")
             
-            # yt-dlp를 사용하여 비디오 정보 가져오기
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-            }
+            import yt_dlp
             
+            # 각 비디오 정보 없이 ID만 빠르게 가져오기
+            ydl_opts = _info_opts(extract_flat='in_playlist')
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(self.url, download=False)
+            
+            # 11자리 YouTube 비디오 ID만 사용 (채널/탭 등 다른 항목 제외)
+            # 같은 비디오가 여러 번 있으면 한 번만 (순서 유지)
+            video_ids = list(dict.fromkeys(
+                entry['id'] for entry in info.get('entries') or []
+                if entry and _VIDEO_ID_RE.fullmatch(str(entry.get('id', '')))))
+            if not video_ids:
+                self.finished.emit(False, f"재생목록에서 비디오를 찾을 수 없습니다:\n{self.url}", [])
+                return
+            
+            self.progress.emit(f"재생목록에서 {len(video_ids)}개 비디오를 찾았습니다.")
+            self.finished.emit(True, info.get('title') or self.url, video_ids)
+            
+        except Exception as e:
+            self.finished.emit(False, f"오류 발생: {str(e)}", [])
+
+
+class ThumbnailDownloader(QRunnable):
+    """썸네일 다운로드를 위한 스레드 풀 작업"""
+    
+    def __init__(self, url, video_id, save_path, quality, convert_to_jpeg=False, session=None):
+        super().__init__()
+        self.url = url
+        self.video_id = video_id
+        self.save_path = Path(save_path)
+        self.quality = quality
+        self.convert_to_jpeg = convert_to_jpeg
+        self.session = session
+        self.signals = DownloaderSignals()
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+    
+    def run(self):
+        try:
+            self.progress.emit(f"YouTube URL 정보를 가져오는 중... ({self.url})")
+            
+            if self.session is None:
+                self.session = _get_session()
+            
+            video_id = self.video_id
+            quality = self.quality
+            
+            # i.ytimg.com 썸네일 URL 직접 확인 (yt-dlp 추출 생략)
+            probed = self.probe_thumbnail_url(video_id, self.quality)
+            if probed:
+                quality, thumbnail_url = probed
+                if quality != self.quality:
+                    self.progress.emit(f"선택한 품질이 없어 {quality} 품질로 대체합니다.")
+                try:
+                    video_title = _fetch_title(video_id)
+                except Exception:
+                    video_title = video_id
+            else:
+                # 직접 확인 실패 시 yt-dlp로 비디오 정보 가져오기 (캐시 재사용)
+                info = _fetch_info(video_id)
                 
                 video_title = info.get('title', 'Unknown')
-                # 파일명에 사용할 수 없는 문자 제거
-                safe_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
                 
                 # 썸네일 URL 찾기
                 thumbnails = info.get('thumbnails', [])
@@ -63,79 +366,86 @@ class ThumbnailDownloader(QThread):
                 if not thumbnail_url:
                     self.finished.emit(False, "선택한 품질의 썸네일을 찾을 수 없습니다.")
                     return
-                
-                self.progress.emit(f"썸네일 다운로드 중... ({self.quality})")
-                
-                # 썸네일 다운로드
-                response = requests.get(thumbnail_url, stream=True)
+            
+            # 파일명에 사용할 수 없는 문자 제거
+            safe_title = video_title.translate(_FNAME_TRANS)
+            
+            self.progress.emit(f"썸네일 다운로드 중... ({quality})")
+            
+            # 파일 확장자 결정 (썸네일 URL의 확장자 사용)
+            ext = os.path.splitext(urlparse(thumbnail_url).path)[1].lower()
+            if ext not in _THUMBNAIL_EXTS:
+                ext = '.jpg'
+            
+            # JPEG 변환 여부 (이미 JPEG이면 원본 그대로 저장)
+            convert = self.convert_to_jpeg and ext != '.jpg'
+            if convert:
+                ext = '.jpg'
+            
+            # 파일 저장 경로 (요청 전에 결정, 제목이 같은 비디오끼리 겹치지 않도록 ID 포함)
+            filename = f"{safe_title}_{video_id}_thumbnail_{quality}{ext}"
+            file_path = self.save_path / filename
+            
+            # 썸네일 다운로드 (본문은 파일로 바로 스트리밍)
+            with self.session.get(thumbnail_url, stream=True, timeout=(5, 30)) as response:
                 response.raise_for_status()
                 
-                # 파일 확장자 결정
-                content_type = response.headers.get('content-type', '')
-                if 'webp' in content_type:
-                    ext = '.webp'
-                elif 'png' in content_type:
-                    ext = '.png'
+                if convert:
+                    # 디코딩/인코딩은 GUI 스레드가 아닌 워커에서 수행
+                    self.progress.emit("JPEG로 변환 중...")
+                    from PIL import Image
+                    image = Image.open(io.BytesIO(response.content)).convert('RGB')
+                    image.save(file_path, 'JPEG', quality=95, optimize=True)
                 else:
-                    ext = '.jpg'
-                
-                # 파일 저장
-                filename = f"{safe_title}_thumbnail_{self.quality}{ext}"
-                file_path = os.path.join(self.save_path, filename)
-                
-                with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                self.progress.emit("썸네일 저장 완료!")
-                self.finished.emit(True, f"썸네일이 저장되었습니다:\n{file_path}")
-                
+                    # 청크 반복 없이 raw 스트림을 큰 버퍼로 복사
+                    response.raw.decode_content = True
+                    with open(file_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+            
+            self.progress.emit("썸네일 저장 완료!")
+            self.finished.emit(True, f"썸네일이 저장되었습니다:\n{file_path}")
+            
         except Exception as e:
             self.finished.emit(False, f"오류 발생: {str(e)}")
     
+    def probe_thumbnail_url(self, video_id, quality):
+        """선택한 품질부터 낮은 품질 순으로 존재하는 썸네일 찾기 (실패 시 None)"""
+        try:
+            return _probe_thumbnail_url(video_id, quality, self.session)
+        except OSError:  # requests 예외는 OSError 하위 클래스
+            return None
+    
     def select_thumbnail_by_quality(self, thumbnails, quality):
         """품질에 따른 썸네일 URL 선택"""
-        # 품질별 우선순위 설정
-        quality_preferences = {
-            'maxres': ['maxresdefault', 'maxres'],
-            'high': ['hqdefault', 'high'],
-            'medium': ['mqdefault', 'medium'],
-            'standard': ['sddefault', 'standard'],
-            'default': ['default']
-        }
-        
-        # 먼저 해상도 기준으로 정렬
-        sorted_thumbnails = sorted(thumbnails, 
-                                 key=lambda x: (x.get('width', 0), x.get('height', 0)), 
-                                 reverse=True)
-        
         # 품질 설정에 따른 선택
-        preferences = quality_preferences.get(quality, ['maxresdefault'])
-        
-        # ID 기준으로 썸네일 찾기
-        for pref in preferences:
-            for thumb in sorted_thumbnails:
-                if pref in str(thumb.get('id', '')).lower():
-                    return thumb['url']
-        
-        # 품질별 해상도 기준으로 선택
-        if quality == 'maxres':
-            return sorted_thumbnails[0]['url'] if sorted_thumbnails else None
-        elif quality == 'high':
-            for thumb in sorted_thumbnails:
-                if thumb.get('width', 0) >= 1280:
-                    return thumb['url']
-        elif quality == 'medium':
-            for thumb in sorted_thumbnails:
-                if 640 <= thumb.get('width', 0) < 1280:
-                    return thumb['url']
-        elif quality == 'standard':
-            for thumb in sorted_thumbnails:
-                if 480 <= thumb.get('width', 0) < 640:
-                    return thumb['url']
-        
-        # 기본값으로 첫 번째 썸네일 반환
-        return sorted_thumbnails[0]['url'] if sorted_thumbnails else None
+        preferences = _QUALITY_PREFERENCES.get(quality, _QUALITY_PREFERENCES['maxres'])
+        low, high = _QUALITY_WIDTH_RANGES.get(quality, (0, 0))
+        
+        # 한 번만 순회하며 (ID 우선순위, 너비 범위 일치, 해상도) 점수가 가장 높은 썸네일 선택
+        best = None
+        best_score = None
+        for thumb in thumbnails:
+            # ID 또는 URL 파일명(maxresdefault 등)이 정확히 일치해야 함
+            thumb_names = (
+                str(thumb.get('id', '')).lower(),
+                os.path.splitext(os.path.basename(urlparse(thumb.get('url', '')).path))[0].lower(),
+            )
+            width = thumb.get('width') or 0
+            resolution = (width, thumb.get('height') or 0)
+            
+            id_score = 0
+            for rank, pref in enumerate(preferences):
+                if pref in thumb_names:
+                    id_score = len(preferences) - rank
+                    break
+            
+            # ID가 일치하면 해상도만 비교, 아니면 너비 범위 일치 여부를 먼저 비교
+            band_score = 0 if id_score else int(low <= width < high)
+            score = (id_score, band_score, resolution)
+            if best_score is None or score > best_score:
+                best, best_score = thumb, score
+        
+        return best['url'] if best else None
 
 
 class YouTubeThumbnailGUI(QMainWindow):
@@ -144,14 +454,11 @@ class YouTubeThumbnailGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.init_ui()
-        self.downloader = None
-        
-        # 기본 저장 경로 설정 (OS별)
-        if platform.system() == "Windows":
-            self.default_save_path = os.path.join(os.path.expanduser("~"), "Desktop")
-        else:  # macOS, Linux
-            self.default_save_path = os.path.join(os.path.expanduser("~"), "Desktop")
+        self.pending_downloads = 0
+        self.download_results = []
         
+        # 기본 저장 경로 설정
+        self.default_save_path = _DEFAULT_SAVE_PATH
         self.save_path = self.default_save_path
         self.path_label.setText(f"저장 경로: {self.save_path}")
     
@@ -160,6 +467,16 @@ class YouTubeThumbnailGUI(QMainWindow):
         self.setWindowTitle("YouTube 썸네일 다운로더")
         self.setGeometry(100, 100, 600, 500)
         
+        # 메뉴
+        tools_menu = self.menuBar().addMenu("도구")
+        clear_cache_action = QAction("캐시 삭제", self)
+        clear_cache_action.triggered.connect(self.clear_cache)
+        tools_menu.addAction(clear_cache_action)
+        
+        # 다운로드 작업용 공유 스레드 풀
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(_MAX_WORKERS)
+        
         # 중앙 위젯 설정
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -182,7 +499,7 @@ class YouTubeThumbnailGUI(QMainWindow):
         
         # URL 입력
         self.url_input = QLineEdit()
-        self.url_input.setPlaceholderText("YouTube URL을 입력하세요 (예: https://www.youtube.com/watch?v=...)")
+        self.url_input.setPlaceholderText("YouTube URL을 입력하세요 (여러 개는 공백으로 구분, 예: https://www.youtube.com/watch?v=...)")
         url_layout.addWidget(self.url_input)
         
         layout.addWidget(url_group)
@@ -220,6 +537,10 @@ class YouTubeThumbnailGUI(QMainWindow):
         settings_layout.addWidget(self.path_label, 1, 1)
         settings_layout.addWidget(self.browse_button, 1, 2)
         
+        # JPEG 변환
+        self.convert_checkbox = QCheckBox("JPEG로 변환하여 저장 (WebP/PNG 썸네일)")
+        settings_layout.addWidget(self.convert_checkbox, 2, 0, 1, 3)
+        
         layout.addWidget(settings_group)
         
         # 다운로드 버튼
@@ -228,11 +549,33 @@ class YouTubeThumbnailGUI(QMainWindow):
         self.download_button.setMinimumHeight(40)
         layout.addWidget(self.download_button)
         
-        # 진행 상황 표시
+        # 완료 상태 표시 (대화상자 대신 3초간 표시)
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: green;")
+        layout.addWidget(self.status_label)
+        
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(3000)
+        self.status_timer.timeout.connect(self.status_label.clear)
+        
+        # 진행 상황 표시 (처음에는 정적 라벨, 오래 걸리면 애니메이션 진행바)
+        self.busy_label = QLabel("다운로드 중...")
+        self.busy_label.setAlignment(Qt.AlignCenter)
+        self.busy_label.setVisible(False)
+        layout.addWidget(self.busy_label)
+        
         self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # 무한 진행바
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
         
+        self.busy_timer = QTimer(self)
+        self.busy_timer.setSingleShot(True)
+        self.busy_timer.setInterval(2000)
+        self.busy_timer.timeout.connect(self.show_busy_progress)
+        
         # 로그 출력
         log_group = QGroupBox("로그")
         log_layout = QVBoxLayout(log_group)
@@ -244,66 +587,110 @@ class YouTubeThumbnailGUI(QMainWindow):
         
         layout.addWidget(log_group)
         
+        # 로그는 버퍼에 모았다가 100ms 뒤 한 번에 출력 (버퍼가 비어 있으면 타이머 정지)
+        self.log_buffer = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(100)
+        self.log_timer.timeout.connect(self.flush_log)
+        
         # 초기 로그 메시지
         self.add_log("프로그램이 시작되었습니다.")
         self.add_log(f"현재 OS: {platform.system()}")
     
     def browse_save_path(self):
         """저장 경로 선택"""
-        folder = QFileDialog.getExistingDirectory(self, "저장 경로 선택", self.save_path)
+        folder = QFileDialog.getExistingDirectory(self, "저장 경로 선택", os.fspath(self.save_path))
         if folder:
-            self.save_path = folder
+            self.save_path = Path(folder)
             self.path_label.setText(f"저장 경로: {self.save_path}")
             self.add_log(f"저장 경로 변경: {self.save_path}")
     
-    def validate_youtube_url(self, url):
-        """YouTube URL 유효성 검사"""
-        youtube_patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})'
-        ]
-        
-        for pattern in youtube_patterns:
-            if re.search(pattern, url):
-                return True
-        return False
+    def clear_cache(self):
+        """비디오 정보 캐시 삭제"""
+        clear_info_cache()
+        self.add_log("캐시를 삭제했습니다.")
     
     def download_thumbnail(self):
         """썸네일 다운로드 시작"""
-        url = self.url_input.text().strip()
+        # 공백/쉼표로 구분된 여러 URL 지원
+        urls = [u for u in _URL_SPLIT_RE.split(self.url_input.text()) if u]
         
-        if not url:
+        if not urls:
             QMessageBox.warning(self, "경고", "YouTube URL을 입력해주세요.")
             return
         
-        if not self.validate_youtube_url(url):
-            QMessageBox.warning(self, "경고", "올바른 YouTube URL을 입력해주세요.")
-            return
+        # URL 유효성 검사 겸 비디오/재생목록 ID 추출 (작업에 그대로 전달)
+        video_ids = [extract_video_id(u) for u in urls]
+        for url, video_id in zip(urls, video_ids):
+            if video_id is None and extract_playlist_id(url) is None:
+                QMessageBox.warning(self, "경고", f"올바른 YouTube URL을 입력해주세요.\n{url}")
+                return
         
-        if not os.path.exists(self.save_path):
+        # 저장 경로는 배치마다 한 번만 확인
+        if not self.save_path.exists():
             QMessageBox.warning(self, "경고", "저장 경로가 존재하지 않습니다.")
             return
         
-        # UI 상태 변경
-        self.download_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # 무한 진행바
-        
         # 선택된 품질 가져오기
         quality_data = self.quality_combo.currentData()
         if quality_data is None:
             quality = "maxres"
         else:
             quality = quality_data
-        
-        self.add_log(f"다운로드 시작: {url}")
+        convert_to_jpeg = self.convert_checkbox.isChecked()
+        
+        if self.pending_downloads == 0:
+            # 새 배치 시작 (UI 상태 변경)
+            self.download_results = []
+            self.status_label.clear()
+            self.busy_label.setVisible(True)
+            self.busy_timer.start()
+            self.add_log(f"다운로드 시작: {len(urls)}개")
+        else:
+            # 진행 중인 배치에 추가
+            self.add_log(f"대기열에 추가: {len(urls)}개")
         self.add_log(f"품질: {self.quality_combo.currentText()}")
         
-        # 다운로더 스레드 시작
-        self.downloader = ThumbnailDownloader(url, self.save_path, quality)
-        self.downloader.progress.connect(self.update_progress)
-        self.downloader.finished.connect(self.download_finished)
-        self.downloader.start()
+        # 스레드 풀에 작업 등록 (비디오마다 하나씩 동시 실행, 재생목록은 먼저 ID 목록을 가져옴)
+        # 저장 경로/설정은 등록 시점 값을 사용 (재생목록 로딩 중 변경되어도 영향 없음)
+        save_path = self.save_path
+        self.pending_downloads += len(urls)
+        for url, video_id in zip(urls, video_ids):
+            if video_id is None:
+                loader = PlaylistLoader(url)
+                loader.progress.connect(self.update_progress)
+                loader.finished.connect(
+                    functools.partial(self.playlist_loaded, save_path, quality, convert_to_jpeg))
+                self.thread_pool.start(loader)
+            else:
+                self.start_download(url, video_id, save_path, quality, convert_to_jpeg)
+    
+    def start_download(self, url, video_id, save_path, quality, convert_to_jpeg):
+        """썸네일 다운로드 작업을 스레드 풀에 등록"""
+        task = ThumbnailDownloader(url, video_id, save_path, quality,
+                                   convert_to_jpeg=convert_to_jpeg)
+        task.progress.connect(self.update_progress)
+        task.finished.connect(self.download_finished)
+        self.thread_pool.start(task)
+    
+    def playlist_loaded(self, save_path, quality, convert_to_jpeg, success, message, video_ids):
+        """재생목록 비디오 ID 목록을 받아 비디오별 다운로드 등록"""
+        if not success:
+            self.download_finished(False, message)
+            return
+        
+        self.add_log(f"재생목록 다운로드 시작: {message} ({len(video_ids)}개)")
+        # 재생목록 작업 하나가 비디오 작업 여러 개로 바뀜
+        self.pending_downloads += len(video_ids) - 1
+        for video_id in video_ids:
+            self.start_download(f"https://youtu.be/{video_id}", video_id, save_path,
+                                quality, convert_to_jpeg)
+    
+    def show_busy_progress(self):
+        """다운로드가 길어지면 애니메이션 진행바로 전환"""
+        self.busy_label.setVisible(False)
+        self.progress_bar.setVisible(True)
     
     def update_progress(self, message):
         """진행 상황 업데이트"""
@@ -311,22 +698,57 @@ class YouTubeThumbnailGUI(QMainWindow):
     
     def download_finished(self, success, message):
         """다운로드 완료 처리"""
-        # UI 상태 복원
-        self.download_button.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        self.download_results.append((success, message))
+        self.pending_downloads -= 1
         
+        progress = f"({len(self.download_results)}/{len(self.download_results) + self.pending_downloads})"
         if success:
-            QMessageBox.information(self, "성공", message)
-            self.add_log("다운로드 완료!")
+            self.add_log(f"다운로드 완료! {progress}")
         else:
-            QMessageBox.critical(self, "오류", message)
-            self.add_log(f"오류: {message}")
+            self.add_log(f"오류: {message} {progress}")
+        
+        if self.pending_downloads > 0:
+            return
+        
+        # 모든 작업 완료 시 UI 상태 복원
+        self.busy_timer.stop()
+        self.busy_label.setVisible(False)
+        self.progress_bar.setVisible(False)
+        
+        # 성공은 상태 표시줄에만 잠시 표시, 오류만 대화상자로 알림
+        if len(self.download_results) == 1:
+            if success:
+                self.show_status(message)
+            else:
+                QMessageBox.critical(self, "오류", message)
+            return
+        
+        succeeded = sum(1 for ok, _ in self.download_results if ok)
+        failed = len(self.download_results) - succeeded
+        summary = f"총 {len(self.download_results)}개 중 {succeeded}개 성공, {failed}개 실패"
+        if failed:
+            QMessageBox.warning(self, "완료", summary)
+        else:
+            self.show_status(summary)
+    
+    def show_status(self, message):
+        """완료 메시지를 상태 라벨에 잠시 표시"""
+        self.status_label.setText(f"✔ {message}")
+        self.status_timer.start()
     
     def add_log(self, message):
         """로그 메시지 추가"""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        if not self.log_buffer:
+            self.log_timer.start()
+        self.log_buffer.append(f"[{timestamp}] {message}")
+    
+    def flush_log(self):
+        """버퍼에 쌓인 로그를 한 번에 출력"""
+        if not self.log_buffer:
+            return
+        self.log_text.append("\n".join(self.log_buffer))
+        self.log_buffer.clear()
         # 스크롤을 맨 아래로
         self.log_text.verticalScrollBar().setValue(
             self.log_text.verticalScrollBar().maximum()